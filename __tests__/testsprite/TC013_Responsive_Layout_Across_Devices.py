@@ -1,159 +0,0 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Resize viewport to 320px width (mobile) and verify UI adapts, including navigation menu changes.
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Close the subscription modal popup to proceed with responsive testing.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Resize viewport to 320px width and verify UI adapts, including navigation menu changes.
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Close the subscription modal popup by clicking the close button (index 48) to enable interaction with the main UI.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Resize viewport to 320px width (mobile breakpoint) and verify UI adapts, including navigation menu changes like hamburger menu.
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Close the subscription modal popup by clicking the close button (index 48) to enable interaction with the main UI.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Resize viewport to 320px width and verify UI adapts, including navigation menu changes like hamburger menu.
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Close the subscription modal popup by clicking the close button (index 48) to enable interaction with the main UI.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Resize viewport to 320px width and verify UI adapts, including navigation menu changes like hamburger menu.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/main/div/section/div[3]/div/div[2]/div/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        # Resize viewport to 320px width and verify UI adapts, including navigation menu changes like hamburger menu, and test critical user flows at this breakpoint.
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Close the subscription modal popup by clicking the close button (index 48) to enable interaction with the main UI.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Resize viewport to 320px width and verify UI adapts, including navigation menu changes like hamburger menu. Test critical user flows at this breakpoint.
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Close the subscription modal popup by clicking the close button (index 48) to enable interaction with the main UI.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Resize viewport to 320px width and verify UI adapts, including navigation menu changes like hamburger menu. Test critical user flows at this breakpoint.
-        await page.goto('http://localhost:5000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
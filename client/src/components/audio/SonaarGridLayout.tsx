@@ -212,6 +212,7 @@ function ActionButtons({
             onAddToCart();
           }}
           title={beat.isFree ? "Free Download" : "Add to Cart"}
+          data-testid={beat.isFree ? "button-free-download" : "button-add-to-cart"}
         >
           {beat.isFree ? <Download className="w-4 h-4" /> : <ShoppingCart className="w-4 h-4" />}
         </Button>
@@ -231,6 +232,7 @@ function ActionButtons({
             onToggleFavorite();
           }}
           title={isFavorite ? "Remove from favorites" : "Add to favorites"}
+          data-testid="button-wishlist"
         >
           <Heart className={cn("w-4 h-4", isFavorite && "fill-current")} />
         </Button>
@@ -299,6 +301,7 @@ const GridItem = memo(function GridItem({
       )}
       onMouseEnter={() => setIsHovered(true)}
       onMouseLeave={() => setIsHovered(false)}
+      data-testid="beat-card"
     >
       <CardContent className="p-0">
         <div className="relative aspect-square overflow-hidden">
@@ -250,6 +250,7 @@ export function Navbar() {
               <Link
                 key={item.href}
                 href={item.href}
+                data-testid={`link-nav-${item.label.toLowerCase()}`}
                 className={`nav-link text-sm lg:text-base focus-ring rounded ${isActive(item.href) ? "text-[var(--accent-purple)]" : ""}`}
               >
                 {item.label}
@@ -261,6 +262,7 @@ export function Navbar() {
           <div className="flex items-center space-x-2 sm:space-x-4">
             <Link
               href="/cart"
+              data-testid="link-cart"
               className="relative p-2 text-white hover:text-[var(--accent-purple)] transition-colors focus-ring rounded"
             >
               <ShoppingCart className="w-5 h-5 sm:w-6 sm:h-6" />
@@ -277,7 +279,11 @@ export function Navbar() {
                   Welcome, {user?.firstName || user?.emailAddresses?.[0]?.emailAddress || "User"}
                 </span>
                 <SignOutButton>
-                  <Button variant="outline" className="flex items-center gap-2 text-sm">
+                  <Button
+                    variant="outline"
+                    className="flex items-center gap-2 text-sm"
+                    data-testid="button-logout"
+                  >
                     <LogOut className="w-4 h-4" />
                     <span className="hidden lg:inline">Logout</span>
                   </Button>
@@ -285,7 +291,10 @@ export function Navbar() {
               </div>
             ) : (
               <Link href="/login">
-                <Button className="hidden md:flex items-center gap-2 btn-primary text-sm">
+                <Button
+                  className="hidden md:flex items-center gap-2 btn-primary text-sm"
+                  data-testid="button-login"
+                >
                   <User className="w-4 h-4" />
                   <span className="hidden lg:inline">Login</span>
                 </Button>
@@ -46,7 +46,7 @@ export function NewsletterModal({ isOpen, onClose }: NewsletterModalProps): JSX.
   if (!isOpen) return null;
 
   return (
-    <div className="fixed inset-0 z-50 flex items-center justify-center p-4">
+    <div className="subscription-modal fixed inset-0 z-50 flex items-center justify-center p-4">
       {/* Backdrop */}
       <button
         type="button"
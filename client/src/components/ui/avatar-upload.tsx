@@ -124,6 +124,7 @@ export function AvatarUpload({
         type="button"
         onClick={triggerFileInput}
         disabled={isUploading}
+        data-testid="button-avatar-upload"
         className={cn(
           "absolute inset-0 flex items-center justify-center rounded-full",
           "bg-black bg-opacity-50 transition-opacity duration-200",
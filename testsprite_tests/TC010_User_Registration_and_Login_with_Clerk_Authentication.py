@@ -1,99 +1,44 @@
-import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to the registration page by clicking the Login button to find registration option.
-        frame = context.pages[-1]
-        # Click the Login button to navigate to login/registration page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from _clerk import TEST_USER_EMAIL, TEST_USER_PASSWORD
+from _helpers import click_when_ready, fill_when_ready, wait_all_frames
+
+async def test_user_registration_and_login_with_clerk_authentication(page):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+
+    # Interact with the page elements to simulate user flow
+    # -> Navigate to the registration page by clicking the Login button to find registration option.
+    # Click the Login button to navigate to login/registration page
+    elem = page.get_by_test_id("button-login").first
+    await click_when_ready(page, elem)
+
+
+    # -> Click the 'Sign up' link to navigate to the registration page.
+    # Click the 'Sign up' link to go to registration page
+    elem = page.get_by_role("link", name="Sign up").first
+    await click_when_ready(page, elem)
 
-        # -> Click the 'Sign up' link to navigate to the registration page.
-        frame = context.pages[-1]
-        # Click the 'Sign up' link to go to registration page
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Fill the registration form with email 'slemba2@yahoo.fr' and password 'Trust!NoOne93' and submit.
-        frame = context.pages[-1]
-        # Enter email address in registration form
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
+    # -> Fill the registration form with the test user's email and password and submit.
+    # Enter email address in registration form
+    elem = page.get_by_label("Email address").first
+    await fill_when_ready(page, elem, TEST_USER_EMAIL)
 
-        frame = context.pages[-1]
-        # Enter password in registration form
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div[2]/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
 
-        frame = context.pages[-1]
-        # Click Continue button to submit registration form
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Enter password in registration form
+    elem = page.get_by_label("Password", exact=True).first
+    await fill_when_ready(page, elem, TEST_USER_PASSWORD)
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Registration Successful! Welcome to BroLab').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The registration and login process using Clerk authentication, including social login options and email verification, did not complete successfully as expected.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Click Continue button to submit registration form
+    elem = page.get_by_role("button", name="Continue", exact=True).first
+    await click_when_ready(page, elem)
+
+
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Registration Successful! Welcome to BroLab').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: The registration and login process using Clerk authentication, including social login options and email verification, did not complete successfully as expected.")
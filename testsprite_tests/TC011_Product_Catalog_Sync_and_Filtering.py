@@ -1,105 +1,51 @@
-import asyncio
-from playwright import async_api
+import pytest
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Trigger a scheduled WooCommerce product catalog sync.
-        frame = context.pages[-1]
-        # Click 'Browse Beats' button to navigate to product catalog page where sync can be triggered or verified.
-        elem = frame.locator('xpath=html/body/div/div/main/div/section/div[3]/div/div/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from _helpers import wait_all_frames
+
+@pytest.mark.skip(reason="The recorded flow opens UnifiedFilterPanel's 'Client-Side Filters' and an error boundary's 'Report Issue' button; /shop renders SonaarFiltersSearch and no page mounts UnifiedFilterPanel")
+async def test_product_catalog_sync_and_filtering(page):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+
+    # Interact with the page elements to simulate user flow
+    # -> Trigger a scheduled WooCommerce product catalog sync.
+    # Click 'Browse Beats' button to navigate to product catalog page where sync can be triggered or verified.
+    elem = page.locator('xpath=html/body/div/div/main/div/section/div[3]/div/div/a/button').nth(0)
+    await page.wait_for_timeout(3000); await elem.click()
+
+
+    # -> Trigger a scheduled WooCommerce product catalog sync.
+    # Click 'Filters' button to open filter options where sync or refresh might be triggered.
+    elem = page.locator('xpath=html/body/div/div/main/div/div/div/button').nth(0)
+    await page.wait_for_timeout(3000); await elem.click()
 
-        # -> Trigger a scheduled WooCommerce product catalog sync.
-        frame = context.pages[-1]
-        # Click 'Filters' button to open filter options where sync or refresh might be triggered.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Check for a button or option to trigger a scheduled WooCommerce product catalog sync.
-        await page.mouse.wheel(0, 300)
-        
+    # -> Check for a button or option to trigger a scheduled WooCommerce product catalog sync.
+    await page.mouse.wheel(0, 300)
 
-        # -> Apply filter by genre.
-        frame = context.pages[-1]
-        # Expand 'Client-Side Filters' to access genre filter options.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Apply filter by genre using available filter options.
-        frame = context.pages[-1]
-        # Click on 'Tags' filter category to check for genre filter options.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Apply filter by genre.
+    # Expand 'Client-Side Filters' to access genre filter options.
+    elem = page.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[2]/div[2]/button').nth(0)
+    await page.wait_for_timeout(3000); await elem.click()
 
-        # -> Report the website issue and stop further testing.
-        frame = context.pages[-1]
-        # Click 'Report Issue' button to report the critical error encountered during filtering.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=WooCommerce Product Catalog Sync Successful').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: WooCommerce product catalog synchronization and filtering by genre, BPM, mood, and price could not be verified as the test plan execution failed.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # -> Apply filter by genre using available filter options.
+    # Click on 'Tags' filter category to check for genre filter options.
+    elem = page.locator('xpath=html/body/div/div/main/div/div[2]/div/div/div').nth(0)
+    await page.wait_for_timeout(3000); await elem.click()
+
+
+    # -> Report the website issue and stop further testing.
+    # Click 'Report Issue' button to report the critical error encountered during filtering.
+    elem = page.locator('xpath=html/body/div/div/main/div/div/div[2]/div[2]/button[2]').nth(0)
+    await page.wait_for_timeout(3000); await elem.click()
+
+
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=WooCommerce Product Catalog Sync Successful').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: WooCommerce product catalog synchronization and filtering by genre, BPM, mood, and price could not be verified as the test plan execution failed.")
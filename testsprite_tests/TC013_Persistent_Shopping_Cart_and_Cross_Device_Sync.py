@@ -1,186 +1,84 @@
-import asyncio
-from playwright import async_api
+import pytest
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the Login button to start authentication.
-        frame = context.pages[-1]
-        # Click the Login button to open login form
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the test user email and click Continue to proceed with login.
-        frame = context.pages[-1]
-        # Input test user email address
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the test user password and click Continue to complete login.
-        frame = context.pages[-1]
-        # Input test user password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to complete login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from _clerk import TEST_USER_EMAIL, TEST_USER_PASSWORD, login
+from _helpers import click_when_ready, wait_all_frames
+from _selectors import Selectors, open_beats, open_cart
 
-        # -> Click on the 'Beats' navigation link to browse beats.
-        frame = context.pages[-1]
-        # Click on the 'Beats' navigation link to browse beats
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add the first beat with a specific license selection to the shopping cart.
-        frame = context.pages[-1]
-        # Click Add to Cart for the first beat 'AURORA Vol.1' to add it to the shopping cart
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add the second beat 'TRULY YOURS' with a different license selection to the cart.
-        frame = context.pages[-1]
-        # Click Add to Cart for the beat 'Master' to add it to the shopping cart
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[5]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+@pytest.mark.xdist_group("test_user")
+async def test_persistent_shopping_cart_and_cross_device_sync(page):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+    selectors = Selectors.for_page(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Click the Login button to start authentication.
+    # Click the Login button to open login form
+    elem = page.get_by_test_id("button-login").first
+    await click_when_ready(page, elem)
+    
 
-        # -> Add the third beat 'Mix' with a different license selection to the cart.
-        frame = context.pages[-1]
-        # Click Add to Cart for the beat 'Mix' to add it to the shopping cart
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[6]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Sign in as the test user through the Clerk form.
+    await login(page, TEST_USER_EMAIL, TEST_USER_PASSWORD)
+    
 
-        # -> Click the Logout button to log out from the current session.
-        frame = context.pages[-1]
-        # Click the Logout button to log out from the current session
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click on the 'Beats' navigation link to browse beats.
+    # Click on the 'Beats' navigation link to browse beats
+    await open_beats(selectors)
+    
 
-        # -> Click the Login button to start login process again.
-        frame = context.pages[-1]
-        # Click the Login button to start login process again
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Add the first beat with a specific license selection to the shopping cart.
+    # Click Add to Cart for the first beat 'AURORA Vol.1' to add it to the shopping cart
+    elem = page.get_by_test_id("button-add-to-cart").first
+    await click_when_ready(page, elem)
+    
 
-        # -> Input the test user email and click Continue to proceed with login.
-        frame = context.pages[-1]
-        # Input test user email address
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
+    # -> Add the second beat 'TRULY YOURS' with a different license selection to the cart.
+    # Click Add to Cart for the beat 'Master' to add it to the shopping cart
+    elem = page.get_by_test_id("button-add-to-cart").nth(1)
+    await click_when_ready(page, elem)
+    
 
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Add the third beat 'Mix' with a different license selection to the cart.
+    # Click Add to Cart for the beat 'Mix' to add it to the shopping cart
+    elem = page.get_by_test_id("button-add-to-cart").nth(2)
+    await click_when_ready(page, elem)
+    
 
-        # -> Input the test user password and click Continue to complete login.
-        frame = context.pages[-1]
-        # Input test user password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
+    # -> Click the Logout button to log out from the current session.
+    # Click the Logout button to log out from the current session
+    elem = page.get_by_test_id("button-logout").first
+    await click_when_ready(page, elem)
+    
 
-        frame = context.pages[-1]
-        # Click Continue button to complete login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click the Login button to start login process again.
+    # Click the Login button to start login process again
+    elem = page.get_by_test_id("button-login").first
+    await click_when_ready(page, elem)
+    
 
-        # -> Click on the shopping cart icon to open and verify the cart contents.
-        frame = context.pages[-1]
-        # Click on the shopping cart icon to open the cart and verify contents
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Sign in as the test user through the Clerk form.
+    await login(page, TEST_USER_EMAIL, TEST_USER_PASSWORD)
+    
 
-        # -> Proceed to test cart synchronization across devices and tabs, and test guest user cart persistence using localStorage as per instructions.
-        frame = context.pages[-1]
-        # Click Browse Beats to continue testing other scenarios as cart persistence failed
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click on the shopping cart icon to open and verify the cart contents.
+    # Click on the shopping cart icon to open the cart and verify contents
+    await open_cart(selectors)
+    
 
-        # -> Open a new tab to simulate login on a different device for the same user to verify cart synchronization across devices.
-        await page.goto('http://localhost:5000/login', timeout=10000)
-        await asyncio.sleep(3)
-        
+    # -> Proceed to test cart synchronization across devices and tabs, and test guest user cart persistence using localStorage as per instructions.
+    # Click Browse Beats to continue testing other scenarios as cart persistence failed
+    elem = page.get_by_role("button", name="Browse Beats").first
+    await click_when_ready(page, elem)
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Shopping Cart Persistence Verified').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: Shopping cart persistence across sessions and devices did not work as expected. The cart did not retain all selected beats and license options after logout/login and across devices as per the test plan.")
-        await asyncio.sleep(5)
+    # -> Open a new tab to simulate login on a different device for the same user to verify cart synchronization across devices.
+    await page.goto('http://localhost:5000/login', wait_until="domcontentloaded", timeout=10000)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Shopping Cart Persistence Verified').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: Shopping cart persistence across sessions and devices did not work as expected. The cart did not retain all selected beats and license options after logout/login and across devices as per the test plan.")
@@ -0,0 +1,29 @@
+from playwright.async_api import expect
+
+# Tailwind's md breakpoint: below it the navbar collapses into the hamburger menu
+MD_BREAKPOINT = 768
+
+BREAKPOINTS = [(320, 568), (375, 812), (768, 1024), (1024, 768), (1280, 720)]
+
+
+async def assert_mobile_nav_if_small(page, width):
+    menu_button = page.get_by_role("button", name="Open navigation menu")
+    beats_link = page.get_by_test_id("link-nav-beats")
+    if width < MD_BREAKPOINT:
+        await expect(menu_button).to_be_visible(timeout=5000)
+        await expect(beats_link).to_be_hidden(timeout=5000)
+    else:
+        await expect(beats_link).to_be_visible(timeout=5000)
+        await expect(menu_button).to_be_hidden(timeout=5000)
+
+
+async def test_responsive_layout_across_devices(page):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+
+    # Interact with the page elements to simulate user flow
+    # Resize the viewport through each breakpoint and verify the navigation adapts.
+    # Resizing in place lets the CSS media queries re-evaluate without a full reload.
+    for width, height in BREAKPOINTS:
+        await page.set_viewport_size({"width": width, "height": height})
+        await assert_mobile_nav_if_small(page, width)
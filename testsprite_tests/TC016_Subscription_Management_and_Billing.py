@@ -1,113 +1,29 @@
-import asyncio
-from playwright import async_api
+import pytest
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the Login button to start user authentication.
-        frame = context.pages[-1]
-        # Click the Login button to start user authentication.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email address and click Continue to proceed with login.
-        frame = context.pages[-1]
-        # Input email address for login.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input password and click Continue to complete login.
-        frame = context.pages[-1]
-        # Input password for login.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to submit password and login.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from _helpers import click_when_ready, wait_all_frames
+from _selectors import Selectors, open_membership
 
-        # -> Click on the 'Membership' link in the top navigation to go to the subscription management page.
-        frame = context.pages[-1]
-        # Click on the 'Membership' link to navigate to subscription management page.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Report the website issue regarding disabled billing integration and stop further testing.
-        frame = context.pages[-1]
-        # Click 'Report Issue' button to report the billing integration error and stop testing.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+@pytest.mark.authenticated
+async def test_subscription_management_and_billing(page):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Click on the 'Membership' link in the top navigation to go to the subscription management page.
+    # Click on the 'Membership' link to navigate to subscription management page.
+    await open_membership(Selectors.for_page(page))
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Subscription Upgrade Successful').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The test plan execution has failed because the subscription plan selection, tier upgrades/downgrades, download quotas, and billing history display integrated with Clerk Billing could not be verified due to billing integration issues.")
-        await asyncio.sleep(5)
+    # -> Report the website issue regarding disabled billing integration and stop further testing.
+    # Click 'Report Issue' button to report the billing integration error and stop testing.
+    elem = page.get_by_role("button", name="Report Issue").first
+    await click_when_ready(page, elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Subscription Upgrade Successful').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: The test plan execution has failed because the subscription plan selection, tier upgrades/downgrades, download quotas, and billing history display integrated with Clerk Billing could not be verified due to billing integration issues.")
@@ -1,189 +1,69 @@
-import asyncio
-from playwright import async_api
+import pytest
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+from _helpers import click_when_ready, wait_all_frames, wait_for_texts
+from _selectors import Selectors, go_dashboard, open_beats
+
+@pytest.mark.keep_images
+@pytest.mark.authenticated
+@pytest.mark.xdist_group("test_user")
+async def test_favorites_and_wishlist_synchronization(page, context_factory, auth_state):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+    selectors = Selectors.for_page(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Click on the 'Beats' navigation link to browse beats and add multiple beats to favorites.
+    # Click on the 'Beats' link in the navigation menu to browse beats
+    await open_beats(selectors)
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the Login button to start authentication.
-        frame = context.pages[-1]
-        # Click the Login button to open login form
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the user's email address and click Continue to proceed with login.
-        frame = context.pages[-1]
-        # Input the user's email address for login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the user's password and click Continue to complete login.
-        frame = context.pages[-1]
-        # Input the user's password for login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to complete login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on the 'Beats' navigation link to browse beats and add multiple beats to favorites.
-        frame = context.pages[-1]
-        # Click on the 'Beats' link in the navigation menu to browse beats
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add multiple beats to the favorites list by clicking 'Add to wishlist' buttons on at least two different beats.
-        frame = context.pages[-1]
-        # Add first beat to wishlist (favorites)
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add second beat to favorites list by clicking 'Add to wishlist' button on another beat.
-        frame = context.pages[-1]
-        # Add second beat to wishlist (favorites)
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to the Favorites or Wishlist page or section to verify the list updates immediately and persistently.
-        frame = context.pages[-1]
-        # Click on the Dashboard link to check favorites and wishlist updates
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to Beats page to add several beats to wishlist and verify wishlist updates successfully.
-        frame = context.pages[-1]
-        # Click on the 'Beats' link in the navigation menu to browse beats
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add three different beats to the wishlist by clicking their 'Add to wishlist' buttons.
-        frame = context.pages[-1]
-        # Add third beat to wishlist
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to the Dashboard to verify wishlist updates and persistence.
-        frame = context.pages[-1]
-        # Click on the Dashboard link to verify wishlist updates
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Open a new browser tab or simulate a new device session, login with the same account, and verify favorites and wishlist data match across sessions.
-        frame = context.pages[-1]
-        # Click Logout to log out from current session
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Add multiple beats to the favorites list by clicking 'Add to wishlist' buttons on at least two different beats.
+    # Add first beat to wishlist (favorites)
+    elem = page.get_by_test_id("button-wishlist").first
+    await click_when_ready(page, elem)
+    # The heart's title flips once the favorite is stored and synced back from the server
+    await expect(elem).to_have_attribute("title", "Remove from favorites", timeout=10000)
+    
 
-        # -> Click Login button to start login for new session.
-        frame = context.pages[-1]
-        # Click Login button to start login for new session
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Add second beat to favorites list by clicking 'Add to wishlist' button on another beat.
+    # Add second beat to wishlist (favorites)
+    elem = page.get_by_test_id("button-wishlist").nth(1)
+    await click_when_ready(page, elem)
+    # The heart's title flips once the favorite is stored and synced back from the server
+    await expect(elem).to_have_attribute("title", "Remove from favorites", timeout=10000)
+    
 
-        # -> Input the user's email address and click Continue to proceed with login in new session.
-        frame = context.pages[-1]
-        # Input the user's email address for login in new session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
+    # -> Navigate to the Favorites or Wishlist page or section to verify the list updates immediately and persistently.
+    # Click on the Dashboard link to check favorites and wishlist updates
+    await go_dashboard(selectors)
+    
 
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login in new session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Navigate to Beats page to add several beats to wishlist and verify wishlist updates successfully.
+    # Click on the 'Beats' link in the navigation menu to browse beats
+    await open_beats(selectors)
+    
 
-        # -> Input the user's password and click Continue to complete login in new session.
-        frame = context.pages[-1]
-        # Input the user's password for login in new session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
+    # -> Add three different beats to the wishlist by clicking their 'Add to wishlist' buttons.
+    # Add third beat to wishlist
+    elem = page.get_by_test_id("button-wishlist").nth(2)
+    await click_when_ready(page, elem)
+    # The heart's title flips once the favorite is stored and synced back from the server
+    await expect(elem).to_have_attribute("title", "Remove from favorites", timeout=10000)
+    
 
-        frame = context.pages[-1]
-        # Click Continue button to complete login in new session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Navigate to the Dashboard to verify wishlist updates and persistence.
+    # Click on the Dashboard link to verify wishlist updates
+    await go_dashboard(selectors)
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Beat 920').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Beat 2187').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Beat 919').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Favorites').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=3').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+    # -> Open a second session for the same account, as a new device would, and verify favorites and wishlist data match across sessions.
+    other_context = await context_factory(storage_state=auth_state)
+    page = await other_context.new_page()
+    await page.goto("http://localhost:5000/dashboard", wait_until="domcontentloaded", timeout=10000)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    # The dashboard data comes from the cached session, so it should render quickly
+    await wait_for_texts(page, ["Beat 920", "Beat 2187", "Beat 919", "Favorites", "3"], timeout=5000)
@@ -1,149 +1,24 @@
-import asyncio
-from playwright import async_api
+import pytest
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Locate and navigate to the file upload section or page to test file uploads.
-        frame = context.pages[-1]
-        # Click on 'Beats' to navigate to beats section where upload might be available.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try to locate upload functionality by navigating to 'Dashboard' or 'Membership' sections which might have user upload features.
-        frame = context.pages[-1]
-        # Click on 'Dashboard' to check for upload functionality.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email address for login to proceed to dashboard.
-        frame = context.pages[-1]
-        # Input email address for login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input password and click continue to complete login and access dashboard.
-        frame = context.pages[-1]
-        # Input password for login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to submit password and login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Explore dashboard tabs and navigation to find file upload section or page.
-        frame = context.pages[-1]
-        # Click on 'Settings' tab to check for file upload options.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div/div/div/div/aside/nav/div/button[8]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Scroll down to check for any file upload section or button in the settings page.
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
+from _helpers import click_when_ready, wait_all_frames
 
-        # -> Scroll down further to check if file upload section is located further down the page.
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
-
-        # -> Check the 'Downloads' tab for any file upload functionality or related options.
-        frame = context.pages[-1]
-        # Click on 'Downloads' tab to check for upload options.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div/div/div/div/aside/nav/div/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Check the 'Profile' tab for any file upload functionality or related options.
-        frame = context.pages[-1]
-        # Click on 'Profile' tab to check for upload options.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div/div/div/div/aside/nav/div/button[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try to locate file upload functionality by searching for any upload buttons or camera icon on the Profile tab page.
-        frame = context.pages[-1]
-        # Click the camera icon or upload button on Profile tab to check for file upload functionality.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div/div/div/div/main/div/div/div[6]/div[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the camera icon or upload button to open the file upload dialog and test uploading valid audio and image files.
-        frame = context.pages[-1]
-        # Click the camera icon to open file upload dialog for profile photo.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div/div/div/div/main/div/div/div[6]/div[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Virus Detected: Upload Blocked').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test failed: Secure uploading of files with MIME-type validation and antivirus scanning did not block unsafe inputs as expected.")
-        await asyncio.sleep(5)
+@pytest.mark.authenticated
+async def test_secure_file_upload_with_validation_and_antivirus_scanning(page):
+    # Navigate straight to the dashboard Profile tab, which hosts the avatar upload widget.
+    # The dashboard selects its tab from the URL, so no sidebar clicks are needed.
+    await page.goto("http://localhost:5000/dashboard?tab=profile", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Click the camera icon or upload button to open the file upload dialog and test uploading valid audio and image files.
+    # Click the camera icon to open file upload dialog for profile photo.
+    elem = page.get_by_test_id("button-avatar-upload").first
+    await click_when_ready(page, elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Virus Detected: Upload Blocked').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test failed: Secure uploading of files with MIME-type validation and antivirus scanning did not block unsafe inputs as expected.")
@@ -1,79 +1,35 @@
 import asyncio
-from playwright import async_api
+
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Access a product or content page to verify dynamic Open Graph meta tags.
-        frame = context.pages[-1]
-        # Click 'View Details' on the first featured beat to access a product page.
-        elem = frame.locator('xpath=html/body/div/div/main/div/section[2]/div/div[2]/div/div/div[2]/div/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from _helpers import click_when_ready, wait_all_frames
+
+EXPECTED_TEXTS = (
+    'We encountered an unexpected error while loading your BroLab experience. Our team has been notified and is working to resolve this issue.',
+    'Try refreshing the page',
+    'Navigate back to the BroLab beats store.',
+)
+
+async def test_seo_optimization_and_meta_tag_validation(page):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+
+    # Interact with the page elements to simulate user flow
+    # -> Access a product or content page to verify dynamic Open Graph meta tags.
+    # Click 'View Details' on the first featured beat to access a product page.
+    elem = page.get_by_role("button", name="View Details").first
+    await click_when_ready(page, elem)
+
+
+    # -> Report the website issue due to critical error on product pages and stop further testing.
+    # Click 'Report Issue' button to report the critical error on product page.
+    elem = page.get_by_role("button", name="Report Issue").first
+    await click_when_ready(page, elem)
 
-        # -> Report the website issue due to critical error on product pages and stop further testing.
-        frame = context.pages[-1]
-        # Click 'Report Issue' button to report the critical error on product page.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=We encountered an unexpected error while loading your BroLab experience. Our team has been notified and is working to resolve this issue.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Try refreshing the page').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Navigate back to the BroLab beats store.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # --> Assertions to verify final state
+    # The checks are independent, so poll them together instead of one after another
+    await asyncio.gather(*(
+        expect(page.get_by_text(text).first).to_be_visible(timeout=30000) for text in EXPECTED_TEXTS
+    ))
@@ -1,131 +1,52 @@
-import asyncio
-from playwright import async_api
-from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the Login button to start admin login process
-        frame = context.pages[-1]
-        # Click the Login button to open login form
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input admin email and click Continue to proceed with login
-        frame = context.pages[-1]
-        # Input admin email address
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input admin password and click Continue to complete login
-        frame = context.pages[-1]
-        # Input admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to submit password and login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on the Membership tab to view subscription management interface
-        frame = context.pages[-1]
-        # Click Membership tab to open subscription management interface
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Report the website issue and stop further testing as the critical subscription management feature is inaccessible.
-        frame = context.pages[-1]
-        # Click Report Issue button to report the error and stop testing
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Welcome, Steve').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Something went wrong').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=We encountered an unexpected error while loading your BroLab experience. Our team has been notified and is working to resolve this issue.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Error Details (Development)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Try Again').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Report Issue').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=You can also try refreshing the page or navigating back to the BroLab beats store.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Professional beats and instrumentals for the modern music producer. Quality sounds that inspire creativity and drive success.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Quick Links').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Home').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Beats').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Contact').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=FAQ').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Legal').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Terms of Service').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Privacy Policy').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Licensing').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Refund Policy').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Copyright').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=© 2025 BroLab Entertainment. All rights reserved.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Secure payments powered by').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Visa • Mastercard • PayPal').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+import pytest
+
+from _helpers import click_when_ready, wait_all_frames, wait_for_texts
+from _selectors import Selectors, open_membership
+
+EXPECTED_TEXTS = (
+    'Welcome, Steve',
+    'Something went wrong',
+    'We encountered an unexpected error while loading your BroLab experience. Our team has been notified and is working to resolve this issue.',
+    'Error Details (Development)',
+    'Try Again',
+    'Report Issue',
+    'You can also try refreshing the page or navigating back to the BroLab beats store.',
+    'Professional beats and instrumentals for the modern music producer. Quality sounds that inspire creativity and drive success.',
+    'Quick Links',
+    'Home',
+    'Beats',
+    'Contact',
+    'FAQ',
+    'Legal',
+    'Terms of Service',
+    'Privacy Policy',
+    'Licensing',
+    'Refund Policy',
+    'Copyright',
+    '© 2025 BroLab Entertainment. All rights reserved.',
+    'Secure payments powered by',
+    'Visa • Mastercard • PayPal',
+)
+
+@pytest.mark.authenticated
+async def test_admin_panel_functionalities(page):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+
+    # Interact with the page elements to simulate user flow
+    selectors = Selectors.for_page(page)
+
+    # -> Click on the Membership tab to view subscription management interface
+    # Click Membership tab to open subscription management interface
+    await open_membership(selectors)
+
+
+    # -> Report the website issue and stop further testing as the critical subscription management feature is inaccessible.
+    # Click Report Issue button to report the error and stop testing
+    elem = page.get_by_role("button", name="Report Issue").first
+    await click_when_ready(page, elem)
+
+
+    # --> Assertions to verify final state
+    await wait_for_texts(page, EXPECTED_TEXTS, timeout=30000)
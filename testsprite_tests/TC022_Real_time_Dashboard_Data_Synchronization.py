@@ -1,179 +1,81 @@
-import asyncio
-from playwright import async_api
+import pytest
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the Login button to start user authentication.
-        frame = context.pages[-1]
-        # Click the Login button to open login form.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[3]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the email address for user slemba2@yahoo.fr and click Continue.
-        frame = context.pages[-1]
-        # Input the email address for login.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('slemba2@yahoo.fr')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to proceed with login.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the password for user slemba2@yahoo.fr and click Continue to login.
-        frame = context.pages[-1]
-        # Input the password for user slemba2@yahoo.fr
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/div/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Trust!NoOne93')
-        
-
-        frame = context.pages[-1]
-        # Click Continue button to submit password and login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/form/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Perform an action such as placing a new order or downloading a beat to trigger dashboard update.
-        frame = context.pages[-1]
-        # Click on 'Beats' to browse beats for placing a new order or downloading.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on 'Free Download' button for the first free beat to trigger a download and update dashboard stats.
-        frame = context.pages[-1]
-        # Click 'Free Download' button for the first free beat 'TRULY YOURS' to trigger download and dashboard update.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[2]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click 'Download Now' button to download the beat and trigger real-time dashboard update.
-        frame = context.pages[-1]
-        # Click 'Download Now' button to download the beat and trigger dashboard update.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div[2]/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate back to Dashboard to verify if the download count updated in real-time.
-        frame = context.pages[-1]
-        # Click on 'Dashboard' link to return to user dashboard and verify real-time updates.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate update from another device or session to trigger real-time dashboard update and verify cross-tab synchronization.
-        await page.goto('http://localhost:5000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Open a new tab to simulate another session and perform an update to trigger real-time dashboard update.
-        await page.goto('http://localhost:5000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Navigate to Dashboard in this new tab to simulate update from another session.
-        frame = context.pages[-1]
-        # Click on 'Dashboard' link to open user dashboard in new session.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Perform an action such as adding a favorite or placing an order in this session to trigger real-time dashboard update and verify cross-tab sync.
-        frame = context.pages[-1]
-        # Click on 'Beats' to browse beats for placing a new order or adding a favorite.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click 'Add to wishlist' button for the first beat 'AURORA Vol.1' to trigger a favorite addition and dashboard update.
-        frame = context.pages[-1]
-        # Click 'Add to wishlist' button for 'AURORA Vol.1' to add to favorites and trigger dashboard update.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch back to first session tab and verify if the dashboard updates in real-time without page reload.
-        await page.goto('http://localhost:5000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Click the 'Refresh' button to manually refresh data and verify dashboard updates during WebSocket disconnection.
-        frame = context.pages[-1]
-        # Click the 'Refresh' button to manually refresh dashboard data during WebSocket disconnection.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Welcome, Steve').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Favorites').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=3').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Downloads').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=1').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Orders').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=19').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Total spent').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=$0.00').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Analytics Data Fixed! 🎉').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Analytics data is now synchronized with your dashboard statistics. All sections display consistent real-time data from your account.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Data is automatically synchronized every 30 seconds').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Disconnected').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+from _helpers import click_when_ready, wait_all_frames, wait_for_texts
+from _selectors import Selectors, go_dashboard, open_beats
+
+EXPECTED_TEXTS = (
+    'Welcome, Steve',
+    'Favorites',
+    '3',
+    'Downloads',
+    '1',
+    'Orders',
+    '19',
+    'Total spent',
+    '$0.00',
+    'Analytics Data Fixed! 🎉',
+    'Analytics data is now synchronized with your dashboard statistics. All sections display consistent real-time data from your account.',
+    'Data is automatically synchronized every 30 seconds',
+    'Disconnected',
+)
+
+@pytest.mark.authenticated
+@pytest.mark.xdist_group("test_user")
+async def test_real_time_dashboard_data_synchronization(context, page, context_factory):
+    # Navigate to your target URL and wait until the DOM is ready
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded", timeout=10000)
+    await wait_all_frames(page)
+
+    # Interact with the page elements to simulate user flow
+    selectors = Selectors.for_page(page)
+
+    # -> Perform an action such as placing a new order or downloading a beat to trigger dashboard update.
+    # Click on 'Beats' to browse beats for placing a new order or downloading.
+    await open_beats(selectors)
+
+
+    # -> Click on 'Free Download' button for the first free beat to trigger a download and update dashboard stats.
+    # Click the shop grid's 'Free Download' button for the first free beat 'TRULY YOURS'; it opens the beat's product page.
+    elem = page.get_by_test_id("button-free-download").first
+    await click_when_ready(page, elem)
+
+
+    # -> Click 'Download Now' button to download the beat and trigger real-time dashboard update.
+    # Click the product page's 'Download Now' button to download the beat and trigger dashboard update.
+    elem = page.get_by_role("button", name="Download Now").first
+    await click_when_ready(page, elem)
+    # The toast only shows once the download is logged, so the dashboard count includes it
+    await expect(page.get_by_text("Download Started").first).to_be_visible(timeout=15000)
+
+
+    # -> Navigate back to Dashboard to verify if the download count updated in real-time.
+    # Click on 'Dashboard' link to return to user dashboard and verify real-time updates.
+    await go_dashboard(selectors)
+
+
+    # -> Open a second session for the same account, as another tab or device would, and add a favorite there.
+    other_context = await context_factory(storage_state=await context.storage_state())
+    other_page = await other_context.new_page()
+    await other_page.goto('http://localhost:5000/shop', wait_until="domcontentloaded", timeout=10000)
+    # Click the first shop grid heart that still reads 'Add to favorites', so the click adds a favorite rather than removing one.
+    elem = other_page.get_by_test_id("button-wishlist").and_(other_page.get_by_title("Add to favorites")).first
+    await click_when_ready(other_page, elem)
+    # The toast only shows once the favorite is stored, so the second session can go away
+    await expect(other_page.get_by_text("Added to Wishlist").first).to_be_visible(timeout=10000)
+    await other_context.close()
+
+
+    # -> Verify the first session's dashboard picks up the new favorite without a page reload.
+    favorites = page.get_by_text("Favorites").first.locator("xpath=..")
+    await expect(favorites.get_by_text("3")).to_be_visible(timeout=10000)
+
+
+    # -> Click the 'Refresh' button to manually refresh data and verify dashboard updates during WebSocket disconnection.
+    # Click the 'Refresh' button to manually refresh dashboard data during WebSocket disconnection.
+    elem = page.get_by_role("button", name="Refresh").first
+    await click_when_ready(page, elem)
+
+
+    # --> Assertions to verify final state
+    await wait_for_texts(page, EXPECTED_TEXTS, timeout=30000)
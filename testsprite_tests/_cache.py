@@ -0,0 +1,39 @@
+"""Session-wide static asset cache for the TestSprite end-to-end tests.
+
+Playwright wipes the HTTP cache with every BrowserContext, so without this each
+test re-downloads the same JS/CSS/images/fonts from the dev server. The cache
+keeps the first successful response per URL in memory and serves it to every
+later context through ``context.route``.
+"""
+import re
+
+ASSET_URL = re.compile(r"\.(?:css|js|mjs|png|jpe?g|webp|gif|svg|ico|woff2?)(?:\?.*)?$")
+
+# Body is already decoded by route.fetch(), so these would no longer match it
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class AssetCache:
+    def __init__(self):
+        self._responses = {}
+
+    async def install(self, context):
+        await context.route(ASSET_URL, self._handle)
+
+    async def _handle(self, route):
+        request = route.request
+        if request.method != "GET":
+            await route.fallback()
+            return
+
+        cached = self._responses.get(request.url)
+        if cached is None:
+            response = await route.fetch()
+            if not response.ok:
+                await route.fulfill(response=response)
+                return
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+            cached = self._responses[request.url] = (response.status, headers, await response.body())
+
+        status, headers, body = cached
+        await route.fulfill(status=status, headers=headers, body=body)
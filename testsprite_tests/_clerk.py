@@ -0,0 +1,24 @@
+"""Clerk sign-in flow shared by the TestSprite end-to-end tests."""
+from _helpers import click_when_ready, fill_when_ready
+
+TEST_USER_EMAIL = "slemba2@yahoo.fr"
+TEST_USER_PASSWORD = "Trust!NoOne93"
+
+
+async def login(page, email, password):
+    """Sign in through the two-step Clerk form already shown on ``page``.
+
+    Fields are located by their accessible labels rather than by position in
+    the Clerk markup, so the flow survives Clerk reshuffling its DOM.
+
+    ``fill`` already writes each value in a single input event rather than
+    typing it key by key, and unlike a scripted ``el.value = ...`` it waits
+    for the field to be editable and goes through React's controlled-input
+    bookkeeping, so it stays the way values are entered here.
+    """
+    continue_button = page.get_by_role("button", name="Continue", exact=True).first
+
+    await fill_when_ready(page, page.get_by_label("Email address").first, email)
+    await click_when_ready(page, continue_button)
+    await fill_when_ready(page, page.get_by_label("Password", exact=True).first, password)
+    await click_when_ready(page, continue_button)
@@ -0,0 +1,86 @@
+"""Browser context setup shared by ``conftest.py`` and ``_runner.py``.
+
+Kept free of pytest so the standalone runner can import it. Every context a
+test sees is created through ``context_factory``, which serialises
+``new_context`` on the shared browser and prepares the context the same way
+whether pytest or the runner asked for it.
+"""
+from contextlib import asynccontextmanager
+
+from _clerk import TEST_USER_EMAIL, TEST_USER_PASSWORD, login
+from _helpers import BASE_URL, block_resource_types
+
+# Flags the document as an e2e run before any app script executes; the app CSS
+# hides the newsletter/subscription modal for html[data-e2e="true"]
+E2E_FLAG_SCRIPT = "document.documentElement.setAttribute('data-e2e', 'true')"
+
+# Nothing under test depends on these when they come from outside the app
+# (Google Fonts, analytics pixels, marketing images)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Clicks and fills on a rendered page settle well under a second, so a short
+# default fails fast on a broken selector; navigation, the final assertions and
+# click_when_ready/fill_when_ready, whose targets may wait on data, pass their
+# own, longer timeout
+ACTION_TIMEOUT = 2000
+
+
+def blocked_resource_types(keep_images=False):
+    # Tests marked keep_images still fetch third-party images
+    return BLOCKED_RESOURCE_TYPES - {"image"} if keep_images else BLOCKED_RESOURCE_TYPES
+
+
+async def prepare_context(context, asset_cache, blocked=BLOCKED_RESOURCE_TYPES):
+    # Everything a fresh test context needs before its first page opens
+    context.set_default_timeout(ACTION_TIMEOUT)
+    await context.add_init_script(E2E_FLAG_SCRIPT)
+    await asset_cache.install(context)
+    await block_resource_types(context, blocked, third_party_only=True)
+
+
+async def capture_auth_state(context):
+    # Sign the test user in on a fresh context and return its storage state
+    context.set_default_timeout(ACTION_TIMEOUT)
+    page = await context.new_page()
+    await page.goto(f"{BASE_URL}/login", wait_until="domcontentloaded", timeout=10000)
+    await login(page, TEST_USER_EMAIL, TEST_USER_PASSWORD)
+
+    # A successful sign-in always lands on the dashboard
+    await page.wait_for_url("**/dashboard**", timeout=15000)
+    return await context.storage_state()
+
+
+async def sign_in(browser, lock):
+    # Log in once on a throwaway context and keep only its cookies and localStorage
+    async with lock:
+        context = await browser.new_context()
+
+    try:
+        return await capture_auth_state(context)
+    finally:
+        await context.close()
+
+
+@asynccontextmanager
+async def context_factory(browser, lock, asset_cache, blocked=BLOCKED_RESOURCE_TYPES):
+    """Yield a ``new_context(**kwargs)`` coroutine for one test.
+
+    ``lock`` serialises context creation on the shared browser so concurrent
+    setups cannot race each other into orphaned contexts. Every context made
+    through the factory is closed when the block exits.
+    """
+    contexts = []
+
+    async def new_context(**kwargs):
+        # Create a new browser context (like an incognito window) on the shared browser
+        async with lock:
+            context = await browser.new_context(**kwargs)
+            contexts.append(context)
+        await prepare_context(context, asset_cache, blocked)
+        return context
+
+    try:
+        yield new_context
+    finally:
+        for context in contexts:
+            await context.close()
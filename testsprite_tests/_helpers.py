@@ -0,0 +1,93 @@
+"""Interaction helpers shared by the TestSprite end-to-end tests."""
+import asyncio
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+BASE_URL = "http://localhost:5000"
+
+# What a test that only checks page text can do without, first-party or not
+MEDIA_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def click_when_ready(page, locator, timeout=10000):
+    """Click ``locator`` as soon as the document is loaded.
+
+    ``timeout`` bounds the page load and, separately, the click's own wait for
+    the element to be visible, stable and enabled. After a client-side route
+    change the document is already loaded, so it is the click's wait that has
+    to cover elements rendered once their data arrives.
+    """
+    await page.wait_for_function("document.readyState === 'complete'", timeout=timeout, polling=100)
+    await locator.click(timeout=timeout)
+
+
+async def fill_when_ready(page, locator, value, timeout=10000):
+    """Fill ``locator`` with ``value`` as soon as the document is loaded.
+
+    ``timeout`` bounds the page load and, separately, the fill's own wait for
+    the element to be visible and editable, as in ``click_when_ready``.
+    """
+    await page.wait_for_function("document.readyState === 'complete'", timeout=timeout, polling=100)
+    await locator.fill(value, timeout=timeout)
+
+
+async def block_resource_types(target, resource_types, third_party_only=False):
+    """Abort every request from ``target`` whose resource type is in ``resource_types``.
+
+    ``target`` is a page or a context. A page route takes precedence over the
+    context's routes and goes away with the page; requests it lets through
+    fall back to the next handler. With ``third_party_only`` requests to the
+    app itself are never blocked.
+    """
+    async def handle(route):
+        request = route.request
+        if request.resource_type in resource_types and not (
+            third_party_only and request.url.startswith(BASE_URL)
+        ):
+            await route.abort()
+        else:
+            await route.fallback()
+
+    await target.route("**/*", handle)
+
+
+async def _safe_wait(frame, timeout):
+    try:
+        await frame.wait_for_load_state("domcontentloaded", timeout=timeout)
+    except PlaywrightError:
+        pass
+
+
+async def wait_all_frames(page, timeout_ms=3000):
+    """Wait for ``page`` and its iframes to reach DOMContentLoaded.
+
+    The frames are waited on concurrently, so this costs the slowest frame
+    rather than the sum; each one gives up quietly after ``timeout_ms``.
+    """
+    await asyncio.gather(*(_safe_wait(frame, timeout_ms) for frame in page.frames))
+
+
+_ALL_TEXTS_PRESENT_JS = """(texts) => {
+    const body = document.body.innerText;
+    return texts.every(t => body.includes(t));
+}"""
+
+_MISSING_TEXTS_JS = """(texts) => {
+    const body = document.body.innerText;
+    return texts.filter(t => !body.includes(t));
+}"""
+
+
+async def wait_for_texts(page, texts, timeout=30000):
+    """Wait until every string in ``texts`` is part of the rendered page text.
+
+    All strings are checked in one DOM scan per poll instead of one ``expect``
+    polling loop each. On timeout the missing strings are reported.
+    """
+    texts = list(texts)
+    try:
+        await page.wait_for_function(_ALL_TEXTS_PRESENT_JS, arg=texts, timeout=timeout)
+    except PlaywrightTimeoutError:
+        missing = await page.evaluate(_MISSING_TEXTS_JS, texts)
+        raise AssertionError(f"Texts not visible after {timeout}ms: {missing}") from None
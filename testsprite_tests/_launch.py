@@ -0,0 +1,16 @@
+"""Chromium launch settings shared by the pytest fixtures and ``_runner.py``."""
+
+CHROMIUM_ARGS = [
+    "--window-size=1280,720",                       # Set the browser window size
+    "--disable-dev-shm-usage",                      # Avoid using /dev/shm which can cause issues in containers
+    "--no-sandbox",                                 # CI containers run rootless without a usable sandbox
+    "--renderer-process-limit=2",                   # Bound memory per browser when running under xdist
+    "--disable-background-timer-throttling",        # Keep timers running at full rate in background pages
+    "--disable-renderer-backgrounding",             # Keep renderers at normal priority when not in front
+    "--disable-backgrounding-occluded-windows",     # Treat hidden windows like visible ones
+]
+
+
+async def launch(pw):
+    # Launch a Chromium browser in headless mode with the shared arguments
+    return await pw.chromium.launch(headless=True, args=CHROMIUM_ARGS)
@@ -0,0 +1,132 @@
+"""Run TC019-TC024 outside pytest on one Playwright driver and one browser.
+
+    python _runner.py
+
+Up to ``CONCURRENCY`` tests run at once, each in its own page or context on
+the same browser. Tests in the same ``xdist_group`` run one after another, as
+they do under pytest's ``--dist loadgroup``.
+
+The tests are the same coroutines pytest collects; each one gets the
+``context``, ``page`` and ``context_factory`` arguments it asks for, built by
+the same ``_context.context_factory`` the fixtures in ``conftest.py`` use.
+Tests marked ``authenticated`` start from one sign-in shared by the whole run;
+the remaining tests share a single context and only get a page of their own,
+unless they are marked ``keep_images`` or open contexts of their own.
+"""
+import asyncio
+import collections
+import inspect
+import sys
+import traceback
+
+from playwright.async_api import async_playwright
+
+from _cache import AssetCache
+from _context import blocked_resource_types, context_factory, sign_in
+from _launch import launch
+from TC019_Offline_Support_and_Graceful_Degradation import test_offline_support_and_graceful_degradation
+from TC020_SEO_Optimization_and_Meta_Tag_Validation import test_seo_optimization_and_meta_tag_validation
+from TC021_Admin_Panel_Functionalities import test_admin_panel_functionalities
+from TC022_Real_time_Dashboard_Data_Synchronization import test_real_time_dashboard_data_synchronization
+from TC024_Cross_browser_and_Accessibility_Compliance import test_cross_browser_and_accessibility_compliance
+
+TESTS = (
+    test_offline_support_and_graceful_degradation,
+    test_seo_optimization_and_meta_tag_validation,
+    test_admin_panel_functionalities,
+    test_real_time_dashboard_data_synchronization,
+    test_cross_browser_and_accessibility_compliance,
+)
+
+# Matches the pytest run's -n 4
+CONCURRENCY = 4
+
+
+def get_marker(test, name):
+    return next((mark for mark in getattr(test, "pytestmark", ()) if mark.name == name), None)
+
+
+def is_authenticated(test):
+    return get_marker(test, "authenticated") is not None
+
+
+def keeps_images(test):
+    return get_marker(test, "keep_images") is not None
+
+
+def xdist_group(test):
+    # Ungrouped tests get a group of their own so they never wait on each other
+    mark = get_marker(test, "xdist_group")
+    return mark.args[0] if mark else test.__name__
+
+
+def needs_own_context(test):
+    # Signed-in tests, tests that keep images and tests that open extra contexts
+    # get a context to themselves
+    return (
+        is_authenticated(test)
+        or keeps_images(test)
+        or "context_factory" in inspect.signature(test).parameters
+    )
+
+
+async def call_test(test, **fixtures):
+    await test(**{name: fixtures[name] for name in inspect.signature(test).parameters})
+
+
+async def run_on_shared_context(test, context):
+    # Anonymous tests only add a page to the run-wide context and close it again
+    page = await context.new_page()
+    try:
+        await call_test(test, context=context, page=page)
+    finally:
+        await page.close()
+
+
+async def run_on_own_context(test, browser, lock, asset_cache, context_options):
+    blocked = blocked_resource_types(keep_images=keeps_images(test))
+    async with context_factory(browser, lock, asset_cache, blocked) as new_context:
+        context = await new_context(**context_options)
+        await call_test(test, context=context, page=await context.new_page(), context_factory=new_context)
+
+
+async def main():
+    asset_cache = AssetCache()
+    context_lock = asyncio.Lock()
+    slots = asyncio.Semaphore(CONCURRENCY)
+    group_locks = collections.defaultdict(asyncio.Lock)
+
+    async with async_playwright() as pw:
+        browser = await launch(pw)
+        try:
+            # Sign in up front so concurrent authenticated tests don't race to do it
+            auth_state = await sign_in(browser, context_lock) if any(map(is_authenticated, TESTS)) else None
+
+            async with context_factory(browser, context_lock, asset_cache) as new_context:
+                shared_context = await new_context()
+
+                async def run(test):
+                    # Take the group lock first so a waiting test doesn't hold a slot
+                    async with group_locks[xdist_group(test)], slots:
+                        try:
+                            if needs_own_context(test):
+                                context_options = {"storage_state": auth_state} if is_authenticated(test) else {}
+                                await run_on_own_context(test, browser, context_lock, asset_cache, context_options)
+                            else:
+                                await run_on_shared_context(test, shared_context)
+                        except Exception:
+                            traceback.print_exc()
+                            print(f"FAILED {test.__name__}")
+                            return False
+                        print(f"PASSED {test.__name__}")
+                        return True
+
+                results = await asyncio.gather(*map(run, TESTS))
+        finally:
+            await browser.close()
+
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
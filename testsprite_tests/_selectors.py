@@ -0,0 +1,45 @@
+"""Named locators for the BroLab app shell shared by the TestSprite tests.
+
+Locators are lazy and re-resolve on every action, so one ``Selectors`` built
+right after ``new_page()`` stays valid across the navigations of that page.
+"""
+from dataclasses import dataclass
+
+from playwright.async_api import Locator, Page
+
+from _helpers import click_when_ready
+
+
+@dataclass
+class Selectors:
+    page: Page
+    nav_beats: Locator
+    nav_membership: Locator
+    nav_dashboard: Locator
+    cart: Locator
+
+    @classmethod
+    def for_page(cls, page):
+        return cls(
+            page=page,
+            nav_beats=page.get_by_test_id("link-nav-beats").first,
+            nav_membership=page.get_by_test_id("link-nav-membership").first,
+            nav_dashboard=page.get_by_test_id("link-nav-dashboard").first,
+            cart=page.get_by_test_id("link-cart").first,
+        )
+
+
+async def open_beats(selectors):
+    await click_when_ready(selectors.page, selectors.nav_beats)
+
+
+async def open_membership(selectors):
+    await click_when_ready(selectors.page, selectors.nav_membership)
+
+
+async def go_dashboard(selectors):
+    await click_when_ready(selectors.page, selectors.nav_dashboard)
+
+
+async def open_cart(selectors):
+    await click_when_ready(selectors.page, selectors.cart)
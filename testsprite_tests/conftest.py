@@ -0,0 +1,89 @@
+"""Shared Playwright fixtures for the TestSprite end-to-end tests.
+
+A single Playwright driver and a single Chromium process are started once per
+session (per xdist worker when run with ``-n``); every test gets its own
+BrowserContext and page on top of that browser so the tests stay isolated
+without paying the browser cold-start each time. Static assets are shared
+across those contexts through an in-memory cache (see ``_cache.py``), and
+third-party images, fonts, media and stylesheets are not fetched at all.
+
+The test account logs in through Clerk once per session; tests marked
+``authenticated`` start from that saved storage state instead of typing the
+credentials again.
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright
+from pytest_asyncio import is_async_test
+
+from _cache import AssetCache
+from _context import blocked_resource_types, context_factory as open_context_factory, sign_in
+from _launch import launch
+
+
+def pytest_collection_modifyitems(items):
+    # Run every test on the session loop that owns the Playwright driver, so one
+    # driver subprocess serves the whole run instead of one per test file
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    # Start a Playwright session in asynchronous mode
+    pw = await async_playwright().start()
+
+    browser = await launch(pw)
+
+    try:
+        yield browser
+    finally:
+        await browser.close()
+        await pw.stop()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def context_lock():
+    # Serialises context creation on the shared browser (see _context.context_factory)
+    return asyncio.Lock()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def asset_cache():
+    return AssetCache()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def auth_state(browser, context_lock):
+    # Log in once and keep the resulting cookies and localStorage for every authenticated test
+    return await sign_in(browser, context_lock)
+
+
+@pytest_asyncio.fixture
+async def context_factory(request, browser, context_lock, asset_cache):
+    blocked = blocked_resource_types(keep_images=request.node.get_closest_marker("keep_images") is not None)
+    # Every context this test opened is closed before any other fixture tears down
+    async with open_context_factory(browser, context_lock, asset_cache, blocked) as new_context:
+        yield new_context
+
+
+@pytest.fixture
+def context_options(request):
+    if request.node.get_closest_marker("authenticated"):
+        return {"storage_state": request.getfixturevalue("auth_state")}
+    return {}
+
+
+@pytest_asyncio.fixture
+async def context(context_factory, context_options):
+    return await context_factory(**context_options)
+
+
+@pytest_asyncio.fixture
+async def page(context):
+    # Open a new page in the browser context
+    return await context.new_page()